@@ -50,13 +50,17 @@ class MakeTea(MakeMeal):
    def eat(self):
       print("Eat Tea")
 
-makePizza = MakePizza()
-makePizza.go()
+def main():
+   makePizza = MakePizza()
+   makePizza.go()
 
-print(25*"+")
+   print(25*"+")
 
-makeTea = MakeTea()
-makeTea.go()
+   makeTea = MakeTea()
+   makeTea.go()
+
+if __name__ == "__main__":
+   main()
 
 """
 OUTPUT:
@@ -14,6 +14,10 @@ https://www.tutorialspoint.com/python_design_patterns/python_design_patterns_abs
 https://sourcemaking.com/design_patterns/abstract_factory
 """
 
+import json
+import sys
+import threading
+
 class Product:
    origin = ""
    component = ""
@@ -74,6 +78,153 @@ class UltimaFactory(IAbstractFactory):
    def getZ(self):
       return UltimaZProduct()
 
+# Data-driven families: build product and factory classes from a spec such as
+# {"Atma": ["X", "Y", "Z"]} instead of writing them by hand.
+def _product_class(origin, component):
+   def __init__(self):
+      Product.__init__(self, origin, component)
+   return type(origin + component + "Product", (Product,), {"__init__": __init__})
+
+def _getter(productclass):
+   def get(self):
+      return productclass()
+   return get
+
+def load_families(spec):
+   """ Return {origin: factory class} for a dict, JSON string or JSON file. """
+   if isinstance(spec, str):
+      if spec.lstrip().startswith("{"):
+         spec = json.loads(spec)
+      else:
+         with open(spec) as f:
+            spec = json.load(f)
+   families = {}
+   for origin, components in spec.items():
+      methods = {}
+      for component in components:
+         methods["get" + component] = _getter(_product_class(origin, component))
+      families[origin] = type(origin + "Factory", (IAbstractFactory,), methods)
+   return families
+
+# Flyweight wrapper: products only carry constant strings, so one read-only
+# instance per (origin, component) is shared by every FlyweightFactory.
+def _read_only(self, *args):
+   raise AttributeError("shared products are read-only")
+
+_shared_classes = {}
+
+def _freeze(product):
+   """ Read-only copy of product, still an instance of its class. """
+   productclass = type(product)
+   shared_class = _shared_classes.get(productclass)
+   if shared_class is None:
+      shared_class = _shared_classes[productclass] = type(
+         "Shared" + productclass.__name__, (productclass,),
+         {"__setattr__": _read_only, "__delattr__": _read_only})
+   shared = object.__new__(shared_class)
+   shared.__dict__.update(product.__dict__)
+   return shared
+
+class FlyweightFactory(IAbstractFactory):
+   # (origin, component) -> read-only product, shared by every wrapper
+   _shared = {}
+   # (factory class, method name) -> (origin, component) it produces
+   _probed = {}
+
+   def __init__(self, factory):
+      self._factory = factory
+      self._products = {}
+      # allocated: products built by the wrapped factory to learn their key
+      # created: new shared products; reused: calls served without allocating
+      self.allocated = 0
+      self.created = 0
+      self.reused = 0
+
+   def _intern(self, name):
+      shared = self._products.get(name)
+      if shared is None:
+         shared = self._products[name] = self._lookup(name)
+      else:
+         self.reused += 1
+      return shared
+
+   def _lookup(self, name):
+      probe = (type(self._factory), name)
+      key = FlyweightFactory._probed.get(probe)
+      if key is not None:
+         shared = FlyweightFactory._shared.get(key)
+         if shared is not None:
+            self.reused += 1
+            return shared
+      product = getattr(self._factory, name)()
+      self.allocated += 1
+      key = FlyweightFactory._probed[probe] = (product.getOrigin(), product.startComponent())
+      shared = FlyweightFactory._shared.get(key)
+      if shared is None:
+         shared = FlyweightFactory._shared.setdefault(key, _freeze(product))
+         self.created += 1
+      return shared
+
+   def getX(self):
+      return self._intern("getX")
+   def getY(self):
+      return self._intern("getY")
+   def getZ(self):
+      return self._intern("getZ")
+
+   def stats(self):
+      """ Counts of allocated, shared and reused products, with the bytes
+      the reused calls saved. """
+      size = 0
+      for product in self._products.values():
+         size = sys.getsizeof(product) + sys.getsizeof(product.__dict__)
+         break
+      return {"allocated": self.allocated, "created": self.created,
+              "reused": self.reused, "bytes_saved": self.reused * size}
+
+# Picks a family by key and keeps one factory per family, safe to share
+# between threads. With pool=True each factory also shares its products.
+class FactoryProvider:
+   def __init__(self, families, pool=False):
+      self._families = dict(families)
+      self._pool = pool
+      self._factories = {}
+      self._lock = threading.Lock()
+      self.hits = 0
+      self.misses = 0
+
+   def get(self, key):
+      with self._lock:
+         factory = self._factories.get(key)
+         if factory is not None:
+            self.hits += 1
+            return factory
+         self.misses += 1
+         factory = self._families[key]()
+         if self._pool:
+            factory = _LockedFactory(FlyweightFactory(factory))
+         self._factories[key] = factory
+         return factory
+
+class _LockedFactory(IAbstractFactory):
+   def __init__(self, factory):
+      self._factory = factory
+      self._lock = threading.Lock()
+
+   def getX(self):
+      with self._lock:
+         return self._factory.getX()
+   def getY(self):
+      with self._lock:
+         return self._factory.getY()
+   def getZ(self):
+      with self._lock:
+         return self._factory.getZ()
+
+   def stats(self):
+      with self._lock:
+         return self._factory.stats()
+
 if __name__ == "__main__":
    product1 = AtmaFactory()
    product2 = UltimaFactory()
@@ -96,6 +247,23 @@ if __name__ == "__main__":
    print("Start component", componentYP2.startComponent(), " from origin", componentYP2.getOrigin())
    print("Start component", componentZP2.startComponent(), " from origin", componentZP2.getOrigin())
 
+   print("--- Product 3 (from spec) ---")
+   product3 = load_families('{"Emerald": ["X", "Y"]}')["Emerald"]()
+   componentXP3 = product3.getX()
+   print("Start component", componentXP3.startComponent(), " from origin", componentXP3.getOrigin())
+
+   print("--- Shared products ---")
+   shared = FlyweightFactory(AtmaFactory())
+   print("Same X instance:", shared.getX() is shared.getX())
+   print("Created", shared.stats()["created"], " reused", shared.stats()["reused"])
+
+   print("--- Provider ---")
+   provider = FactoryProvider({"Atma": AtmaFactory, "Ultima": UltimaFactory})
+   for key in ["Atma", "Ultima", "Atma"]:
+      componentX = provider.get(key).getX()
+      print("Start component", componentX.startComponent(), " from origin", componentX.getOrigin())
+   print("Hits", provider.hits, " misses", provider.misses)
+
 """
 OUTPUT:
 --- Product 1 ---
@@ -106,5 +274,15 @@ Start component Z  from origin Atma
 Start component X  from origin Ultima
 Start component Y  from origin Ultima
 Start component Z  from origin Ultima
+--- Product 3 (from spec) ---
+Start component X  from origin Emerald
+--- Shared products ---
+Same X instance: True
+Created 1  reused 1
+--- Provider ---
+Start component X  from origin Atma
+Start component X  from origin Ultima
+Start component X  from origin Atma
+Hits 1  misses 2
 [Finished in 0.1s]
 """
\ No newline at end of file
@@ -33,15 +33,39 @@ class Product1Factory():
       targetclass = typ.capitalize()
       return globals()[targetclass]()
 
-component_obj = Product1Factory()
-component = ["Component1", "Component2", "Component3"]
-for b in component:
-   print(component_obj.create_component(b).startComponent())
+   def create_many(self, types, lazy=False):
+      """ Create one product per name, resolving each class only once.
+      With lazy=True the products are yielded one at a time instead
+      of being collected into a list. """
+      products = self._build(types)
+      return products if lazy else list(products)
+
+   def _build(self, types):
+      classes = {}
+      for typ in types:
+         targetclass = classes.get(typ)
+         if targetclass is None:
+            targetclass = classes[typ] = globals()[typ.capitalize()]
+         yield targetclass()
+
+def main():
+   component_obj = Product1Factory()
+   component = ["Component1", "Component2", "Component3"]
+   for b in component:
+      print(component_obj.create_component(b).startComponent())
+   for product in component_obj.create_many(component, lazy=True):
+      print(product.startComponent())
+
+if __name__ == "__main__":
+   main()
 
 """
 OUTPUT:
 Atma
 Ultima
 Emerald
+Atma
+Ultima
+Emerald
 [Finished in 0.1s]
 """
\ No newline at end of file
@@ -35,14 +35,18 @@ class Singleton:
    def getTest(self):
    	return self.test
 
-firstInstance = Singleton()
-secondInstance = Singleton.getInstance()
+def main():
+   firstInstance = Singleton()
+   secondInstance = Singleton.getInstance()
 
-firstInstance.setTest("Ultima")
-print("SecondInstance - variable test: ", secondInstance.getTest())
+   firstInstance.setTest("Ultima")
+   print("SecondInstance - variable test: ", secondInstance.getTest())
 
-print("Trying to create another instance:")
-x = Singleton()
+   print("Trying to create another instance:")
+   x = Singleton()
+
+if __name__ == "__main__":
+   main()
 """
 OUTPUT:
 SecondInstance - variable test: Ultima
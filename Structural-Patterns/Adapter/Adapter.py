@@ -34,6 +34,8 @@ class Socket(EuropeanSocketInterface):
 		return 0
 
 # Target interface
+USA_VOLTAGE = 110
+
 class USASocketInterface:
    def voltage(self): pass
    def live(self): pass
@@ -46,7 +48,7 @@ class Adapter(USASocketInterface):
       self.__socket = socket
    
    def voltage(self):
-      return 110
+      return USA_VOLTAGE
    
    def live(self):
       return self.__socket.live()
@@ -54,6 +56,41 @@ class Adapter(USASocketInterface):
    def neutral(self):
       return self.__socket.neutral()
 
+# Adapter builder: pass-through methods are the adaptee's own bound methods,
+# so calls skip the extra frame of a hand-written forwarding method.
+def make_adapter(target, mapping, overrides=None):
+   """ Build an adapter class for target. mapping is {target method: adaptee
+   method}; overrides is {target method: function} for custom behaviour.
+   Every public method of target must be in exactly one of the two. """
+   overrides = overrides or {}
+   both = set(mapping) & set(overrides)
+   if both:
+      raise ValueError("mapped and overridden: " + ", ".join(sorted(both)))
+   methods = set(name for name in dir(target)
+                 if not name.startswith("_") and callable(getattr(target, name)))
+   unmapped = methods - set(mapping) - set(overrides)
+   if unmapped:
+      raise ValueError("neither mapped nor overridden: " + ", ".join(sorted(unmapped)))
+   def __init__(self, adaptee):
+      for name, adaptee_name in mapping.items():
+         setattr(self, name, getattr(adaptee, adaptee_name))
+   namespace = dict(overrides)
+   namespace["__init__"] = __init__
+   return type("Generated" + target.__name__, (target,), namespace)
+
+# Bulk adapter: converts many European sockets to USA readings per call.
+# This is a plain loop over the sockets, not a vectorized pass; it only
+# saves creating an Adapter per socket.
+class BulkAdapter:
+   def convert(self, sockets):
+      """ Return a (voltage, live, neutral) USA reading for each socket. """
+      return list(self.stream(sockets))
+
+   def stream(self, sockets):
+      """ Yield the readings one at a time, for unbounded input. """
+      for socket in sockets:
+         yield (USA_VOLTAGE, socket.live(), socket.neutral())
+
 # Client
 class ElectricKettle:
 	__power = None
@@ -62,7 +99,7 @@ class ElectricKettle:
 	   self.__power = power
 
 	def boil(self):
-		if self.__power.voltage() > 110:
+		if self.__power.voltage() > USA_VOLTAGE:
 			print("Kettle on fire!")
 		elif self.__power.live() == 1 and self.__power.neutral() == -1:
 			print("Coffee time!")
@@ -78,6 +115,12 @@ def main():
 	# Make coffee
 	kettle.boil()
 
+	# Same adapter, generated from a mapping
+	GeneratedAdapter = make_adapter(USASocketInterface,
+		{"live": "live", "neutral": "neutral"}, {"voltage": lambda self: USA_VOLTAGE})
+	kettle = ElectricKettle(GeneratedAdapter(socket))
+	kettle.boil()
+
 	return 0
 	
 if __name__ == "__main__":
@@ -86,5 +129,6 @@ if __name__ == "__main__":
 """
 OUTPUT:
 Coffee time!
+Coffee time!
 [Finished in 0.0s]
 """
\ No newline at end of file
@@ -16,6 +16,11 @@ https://sourcemaking.com/design_patterns/bridge/python/1
 """
 
 import abc
+import asyncio
+import inspect
+import threading
+import time
+import weakref
 
 class Abstraction:
     """
@@ -30,6 +35,61 @@ class Abstraction:
         return self._imp.operation_imp()
 
 
+class SwitchableAbstraction(Abstraction):
+    """
+    Abstraction whose Implementor can be swapped atomically while in use.
+    Results of deterministic Implementors are cached per Implementor, and
+    call count, cache hits and total latency are kept for each one.
+    Both are dropped once an Implementor is no longer referenced, so
+    swapping in new instances does not grow them.
+    """
+
+    def __init__(self, imp):
+        super().__init__(imp)
+        self._lock = threading.Lock()
+        self._results = weakref.WeakKeyDictionary()
+        self._metrics = weakref.WeakKeyDictionary()
+
+    def set_implementor(self, imp):
+        with self._lock:
+            self._imp = imp
+
+    def operation(self):
+        with self._lock:
+            imp = self._imp
+            metrics = self._metrics.setdefault(
+                imp, {"calls": 0, "hits": 0, "seconds": 0.0})
+            metrics["calls"] += 1
+            if imp in self._results:
+                metrics["hits"] += 1
+                return self._results[imp]
+        start = time.perf_counter()
+        result = imp.operation_imp()
+        elapsed = time.perf_counter() - start
+        with self._lock:
+            metrics["seconds"] += elapsed
+            if getattr(imp, "deterministic", False):
+                self._results[imp] = result
+        return result
+
+    def metrics(self, imp):
+        with self._lock:
+            return dict(self._metrics.get(imp, {}))
+
+
+class AsyncAbstraction(Abstraction):
+    """
+    Abstraction for Implementors whose operation_imp() may be a coroutine,
+    such as ones that call out over a socket.
+    """
+
+    async def operation(self):
+        result = self._imp.operation_imp()
+        if inspect.isawaitable(result):
+            result = await result
+        return result
+
+
 class Implementor(metaclass=abc.ABCMeta):
     """
     Define the interface for implementation classes. This interface
@@ -38,8 +98,12 @@ class Implementor(metaclass=abc.ABCMeta):
     Implementor interface provides only primitive operations, and
     Abstraction defines higher-level operations based on these
     primitives.
+    Set deterministic to True when operation_imp() always returns the
+    same result, so it may be cached.
     """
 
+    deterministic = False
+
     @abc.abstractmethod
     def operation_imp(self):
         pass
@@ -51,6 +115,8 @@ class ConcreteImplementorA(Implementor):
     implementation.
     """
 
+    deterministic = True
+
     def operation_imp(self):
         return "Operation A"
 
@@ -61,10 +127,127 @@ class ConcreteImplementorB(Implementor):
     implementation.
     """
 
+    deterministic = True
+
     def operation_imp(self):
         return "Operation B"
 
 
+class _NotSent(ConnectionError):
+    """ The connection failed before a pipelined batch was written. """
+
+
+class PooledImplementor(Implementor):
+    """
+    Implementor that sends its request line to a remote server and returns
+    the reply line. Connections are kept alive and reused, at most
+    max_connections are open at once, and pipeline() sends several
+    requests on one connection before reading the replies.
+
+    A kept-alive connection the server has since closed is only retried on
+    a new one when the batch cannot have reached the server: the
+    connection was already at EOF or writing to it failed. Once the batch
+    is written a lost reply is raised, since the server may have run the
+    requests; pass idempotent=True to retry those as well.
+    """
+
+    request = b"operation"
+
+    def __init__(self, host, port, max_connections=4, idempotent=False):
+        self._host = host
+        self._port = port
+        self._max_connections = max_connections
+        self._idempotent = idempotent
+        self._slots = None
+        self._idle = []
+
+    async def operation_imp(self):
+        return (await self.pipeline([self.request]))[0]
+
+    async def pipeline(self, requests):
+        # A kept-alive connection may have been closed by the server in the
+        # meantime; retry once on a new one if the batch was never sent.
+        for attempt in range(2):
+            connection, reused = await self._acquire(fresh=attempt > 0)
+            replies = []
+            try:
+                await self._exchange(connection, requests, replies)
+            except OSError as error:
+                self._release(connection, reuse=False)
+                unsent = isinstance(error, _NotSent)
+                if attempt or not reused or replies or not (unsent or self._idempotent):
+                    raise
+                continue
+            except BaseException:
+                self._release(connection, reuse=False)
+                raise
+            self._release(connection)
+            return replies
+
+    async def close(self):
+        while self._idle:
+            _, writer = self._idle.pop()
+            writer.close()
+            await writer.wait_closed()
+
+    async def _exchange(self, connection, requests, replies):
+        reader, writer = connection
+        if reader.at_eof():
+            raise _NotSent("connection closed by server")
+        try:
+            writer.write(b"".join(request + b"\n" for request in requests))
+            await writer.drain()
+        except OSError as error:
+            raise _NotSent(str(error)) from error
+        for _ in requests:
+            line = await reader.readline()
+            if not line.endswith(b"\n"):
+                raise ConnectionError("connection closed by server")
+            replies.append(line.decode().rstrip("\n"))
+
+    async def _acquire(self, fresh=False):
+        # Returns (connection, reused), skipping idle connections the
+        # server has already closed.
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self._max_connections)
+        await self._slots.acquire()
+        while self._idle and not fresh:
+            connection = self._idle.pop()
+            if not connection[0].at_eof():
+                return connection, True
+            connection[1].close()
+        try:
+            return await asyncio.open_connection(self._host, self._port), False
+        except BaseException:
+            self._slots.release()
+            raise
+
+    def _release(self, connection, reuse=True):
+        if reuse:
+            self._idle.append(connection)
+        else:
+            connection[1].close()
+        self._slots.release()
+
+
+async def _remote_operation():
+    # A local stand-in for the remote server: answers every line it reads.
+    async def handle(reader, writer):
+        while await reader.readline():
+            writer.write(b"Operation Remote\n")
+        writer.close()
+
+    server = await asyncio.start_server(handle, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    implementor = PooledImplementor("127.0.0.1", port)
+    try:
+        return await AsyncAbstraction(implementor).operation()
+    finally:
+        await implementor.close()
+        server.close()
+        await server.wait_closed()
+
+
 def main():
     concrete_implementor_a = ConcreteImplementorA()
     concrete_implementor_b = ConcreteImplementorB()
@@ -72,6 +255,11 @@ def main():
     print(abstraction.operation())
     abstraction = Abstraction(concrete_implementor_b)
     print(abstraction.operation())
+    abstraction = SwitchableAbstraction(concrete_implementor_a)
+    print(abstraction.operation())
+    abstraction.set_implementor(concrete_implementor_b)
+    print(abstraction.operation())
+    print(asyncio.run(_remote_operation()))
 
 
 if __name__ == "__main__":
@@ -80,5 +268,8 @@ if __name__ == "__main__":
 OUTPUT:
 Operation A
 Operation B
+Operation A
+Operation B
+Operation Remote
 [Finished in 0.1s]
 """
\ No newline at end of file
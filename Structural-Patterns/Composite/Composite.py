@@ -16,6 +16,8 @@ https://sourcemaking.com/design_patterns/composite
 """
 
 import abc
+import os
+from concurrent.futures import ThreadPoolExecutor
 
 
 class Component(metaclass=abc.ABCMeta):
@@ -30,10 +32,32 @@ class Component(metaclass=abc.ABCMeta):
     (optional).
     """
 
+    _parent = None
+
     @abc.abstractmethod
     def operation(self):
         pass
 
+    def changed(self):
+        """
+        Call after mutating a component so cached results on the path up
+        to the root are recomputed. The walk stops at the first Composite
+        whose ancestors were already invalidated.
+        """
+        parent = self._parent
+        while parent is not None:
+            parent._cache = None
+            if parent._stale:
+                break
+            parent._stale = True
+            parent = parent._parent
+
+    def __getstate__(self):
+        # Pickle only the subtree, not the path back up to the root.
+        state = self.__dict__.copy()
+        state.pop("_parent", None)
+        return state
+
 
 class Composite(Component):
     """
@@ -42,20 +66,170 @@ class Composite(Component):
     Implement child-related operations in the Component interface.
     """
 
-    def __init__(self):
-        self._children = set()
+    def __init__(self, cached=False):
+        # Children in insertion order, stored under their key or, when
+        # added without one, under a private slot object; _keys maps each
+        # child back to its slot.
+        self._children = {}
+        self._keys = {}
+        self._cached = cached
+        self._cache = None
+        # True once the ancestors' caches are known to be invalidated.
+        self._stale = False
 
     def operation(self):
-    	orderLeaf = ""
-    	for child in self._children:
-    		orderLeaf += child.operation() + "\n"
-    	return orderLeaf
+        if self._cache is not None:
+            return self._cache
+        # Post-order without recursion. Uncached sub-Composites write into
+        # their parent's pieces; cached ones join and keep their own result.
+        self._stale = False
+        stack = [(self, iter(self._children.values()), [])]
+        while True:
+            composite, children, pieces = stack[-1]
+            for child in children:
+                if not isinstance(child, Composite):
+                    pieces.append(child.operation())
+                elif child._cache is not None:
+                    child._stale = False
+                    pieces.append(child._cache)
+                else:
+                    child._stale = False
+                    child_pieces = [] if child._cached else pieces
+                    stack.append((child, iter(child._children.values()), child_pieces))
+                    break
+                pieces.append("\n")
+            else:
+                stack.pop()
+                if not stack:
+                    result = "".join(pieces)
+                    if composite._cached:
+                        composite._cache = result
+                    return result
+                parent_pieces = stack[-1][2]
+                if composite._cached:
+                    composite._cache = "".join(pieces)
+                    parent_pieces.append(composite._cache)
+                parent_pieces.append("\n")
+
+    def parallel_operation(self, executor=None, max_workers=None):
+        """
+        Same result as operation(), with subtrees evaluated on an executor
+        (a ThreadPoolExecutor by default; pass a ProcessPoolExecutor for
+        CPU-bound leaves). max_workers sizes the default executor and the
+        partitioning; give it with your own executor too, otherwise the
+        CPU count is used. Composites are split into their children, level
+        by level, so one large subtree does not end up on a single worker,
+        and the units are handed out in small batches so idle workers pick
+        up the remaining ones. The result is not cached here, since a
+        process pool evaluates copies of the subtrees.
+        """
+        if self._cache is not None:
+            return self._cache
+        if executor is None:
+            with ThreadPoolExecutor(max_workers) as executor:
+                return self.parallel_operation(executor, max_workers)
+        workers = max_workers or os.cpu_count() or 1
+        units = list(self._children.values())
+        expanded = True
+        while expanded and len(units) < 64 * workers:
+            expanded = False
+            next_units = []
+            for unit in units:
+                if isinstance(unit, Composite) and unit._cache is None:
+                    # unit.operation() + "\n" == its children's units + "\n"
+                    next_units.extend(unit._children.values())
+                    next_units.append("\n")
+                    expanded = True
+                else:
+                    next_units.append(unit)
+            units = next_units
+        size = max(1, len(units) // (16 * workers))
+        batches = [units[i:i + size] for i in range(0, len(units), size)]
+        return "".join(executor.map(_evaluate, batches))
 
-    def add(self, component):
-        self._children.add(component)
+    def changed(self):
+        self._cache = None
+        if not self._stale:
+            self._stale = True
+            Component.changed(self)
+
+    def iter_operation(self):
+        """
+        Yield the result of every leaf in the subtree, without recursion.
+        """
+        stack = [iter(self._children.values())]
+        while stack:
+            for child in stack[-1]:
+                if isinstance(child, Composite):
+                    stack.append(iter(child._children.values()))
+                    break
+                yield child.operation()
+            else:
+                stack.pop()
+
+    def add(self, component, key=None):
+        """
+        Append component, or replace the child already stored under key.
+        A component has one parent, so it is moved here from any other.
+        """
+        if component._parent is not None:
+            component._parent.remove(component)
+        if key is None:
+            key = object()
+        elif key in self._children:
+            self.replace(key, component)
+            return
+        self._keys[component] = key
+        self._children[key] = component
+        component._parent = self
+        self.changed()
 
     def remove(self, component):
-        self._children.discard(component)
+        key = self._keys.get(component)
+        if key is not None and self._children.get(key) is component:
+            del self._keys[component]
+            del self._children[key]
+            component._parent = None
+            self.changed()
+
+    def child(self, key):
+        return self._children[key]
+
+    def children(self):
+        return list(self._children.values())
+
+    def find(self, *keys):
+        """
+        Follow a path of keys down the tree, one lookup per level.
+        """
+        component = self
+        for key in keys:
+            component = component.child(key)
+        return component
+
+    def replace(self, key, component):
+        """
+        Put component in place of the child stored under key (or of the
+        child given itself, if it was added without a key), keeping its
+        position. A component has one parent, so it is moved here from
+        any other.
+        """
+        if key not in self._children:
+            key = self._keys[key]
+        old = self._children[key]
+        if component is not old and component._parent is not None:
+            component._parent.remove(component)
+        del self._keys[old]
+        old._parent = None
+        self._keys[component] = key
+        self._children[key] = component
+        component._parent = self
+        self.changed()
+
+def _evaluate(units):
+    # One batch of parallel_operation(): components or literal separators.
+    return "".join(unit if isinstance(unit, str) else unit.operation() + "\n"
+                   for unit in units)
 
 
 class Leaf1(Component):
@@ -100,9 +274,9 @@ if __name__ == "__main__":
 
 """
 OUTPUT:
+Leaf 1 - Operation
 Leaf 2 - Operation
 Leaf 3 - Operation
-Leaf 1 - Operation
 
 [Finished in 0.1s]
 """
\ No newline at end of file
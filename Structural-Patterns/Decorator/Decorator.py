@@ -16,11 +16,8 @@ https://www.tutorialspoint.com/python_design_patterns/python_design_patterns_dec
 https://sourcemaking.com/design_patterns/decorator
 """
 
-import six
-from abc import ABCMeta
-
-@six.add_metaclass(ABCMeta)
 class Abstract_Coffee(object):
+   __slots__ = ()
 
    def get_cost(self):
       pass
@@ -32,6 +29,7 @@ class Abstract_Coffee(object):
       return 0.1*self.get_cost()
 
 class Concrete_Coffee(Abstract_Coffee):
+   __slots__ = ()
    
    def get_cost(self):
       return 1.00
@@ -39,50 +37,110 @@ class Concrete_Coffee(Abstract_Coffee):
    def get_ingredients(self):
       return 'coffee'
 
-@six.add_metaclass(ABCMeta)
 class Abstract_Coffee_Decorator(Abstract_Coffee):
+   __slots__ = ('decorated_coffee',)
+   # What this decorator adds on top of the wrapped coffee, used by
+   # get_cost()/get_ingredients() and by Flat_Coffee. extra_ingredient
+   # is None for a decorator that adds no ingredient.
+   extra_cost = 0
+   extra_ingredient = None
    
    def __init__(self,decorated_coffee):
       self.decorated_coffee = decorated_coffee
    
    def get_cost(self):
-      return self.decorated_coffee.get_cost()
+      return self.decorated_coffee.get_cost() + self.extra_cost
    
    def get_ingredients(self):
-      return self.decorated_coffee.get_ingredients()
+      ingredients = self.decorated_coffee.get_ingredients()
+      if self.extra_ingredient is None:
+         return ingredients
+      return ingredients + ', ' + self.extra_ingredient
 
 class Sugar(Abstract_Coffee_Decorator):
-   
-   def __init__(self,decorated_coffee):
-      Abstract_Coffee_Decorator.__init__(self,decorated_coffee)
-   
-   def get_cost(self):
-      return self.decorated_coffee.get_cost()
-   
-   def get_ingredients(self):
-	   return self.decorated_coffee.get_ingredients() + ', sugar'
+   __slots__ = ()
+   extra_cost = 0
+   extra_ingredient = 'sugar'
 
 class Milk(Abstract_Coffee_Decorator):
-   
-   def __init__(self,decorated_coffee):
-      Abstract_Coffee_Decorator.__init__(self,decorated_coffee)
-   
-   def get_cost(self):
-      return self.decorated_coffee.get_cost() + 0.25
-   
-   def get_ingredients(self):
-      return self.decorated_coffee.get_ingredients() + ', milk'
+   __slots__ = ()
+   extra_cost = 0.25
+   extra_ingredient = 'milk'
 
 class Vanilla(Abstract_Coffee_Decorator):
-   
-   def __init__(self,decorated_coffee):
-      Abstract_Coffee_Decorator.__init__(self,decorated_coffee)
-   
+   __slots__ = ()
+   extra_cost = 0.75
+   extra_ingredient = 'vanilla'
+
+def _owner(decorator, name):
+   for klass in decorator.__mro__:
+      if name in klass.__dict__:
+         return klass
+
+_compilable = {}
+
+def _is_compilable(decorator):
+   """ True when the decorator class declares extra_cost and extra_ingredient
+   at or below the classes defining its get_cost() and get_ingredients(),
+   so the extras describe what those methods actually add. """
+   result = _compilable.get(decorator)
+   if result is None:
+      result = _compilable[decorator] = (
+         issubclass(_owner(decorator, 'extra_cost'), _owner(decorator, 'get_cost'))
+         and issubclass(_owner(decorator, 'extra_ingredient'), _owner(decorator, 'get_ingredients')))
+   return result
+
+class Flat_Coffee(Abstract_Coffee):
+   """ A decorator chain compiled into precomputed cost and ingredients,
+   so queries no longer walk (or recurse through) the whole chain.
+   Compiling stops at the first decorator that does not declare what it
+   adds; that part of the chain is priced through its own methods. """
+   __slots__ = ('_cost', '_ingredients')
+
+   def __init__(self,coffee):
+      decorators = []
+      while isinstance(coffee, Abstract_Coffee_Decorator) and _is_compilable(type(coffee)):
+         decorators.append(type(coffee))
+         coffee = coffee.decorated_coffee
+      self._cost = coffee.get_cost()
+      self._ingredients = [coffee.get_ingredients()]
+      for decorator in reversed(decorators):
+         self.add(decorator)
+
+   def add(self,decorator):
+      """ Apply one more decorator class, updating the precomputed values. """
+      if not _is_compilable(decorator):
+         raise TypeError(decorator.__name__ + " overrides get_cost()/get_ingredients() without declaring its extras")
+      if decorator.extra_cost:
+         self._cost += decorator.extra_cost
+      if decorator.extra_ingredient is not None:
+         self._ingredients.append(decorator.extra_ingredient)
+      return self
+
    def get_cost(self):
-      return self.decorated_coffee.get_cost() + 0.75
-   
+      return self._cost
+
    def get_ingredients(self):
-      return self.decorated_coffee.get_ingredients() + ', vanilla'
+      return ', '.join(self._ingredients)
+
+DECORATOR_CODES = {'M': Milk, 'V': Vanilla, 'S': Sugar}
+
+def price_orders(orders):
+   """ Price many orders given as sequences of decorator codes, innermost
+   first (e.g. 'MVS' is Sugar(Vanilla(Milk(Concrete_Coffee())))).
+   Returns (cost, tax, ingredients) tuples; identical orders are priced once. """
+   prices = {}
+   results = []
+   for order in orders:
+      key = tuple(order)
+      price = prices.get(key)
+      if price is None:
+         coffee = Flat_Coffee(Concrete_Coffee())
+         for code in key:
+            coffee.add(DECORATOR_CODES[code])
+         price = prices[key] = (coffee.get_cost(), coffee.get_tax(), coffee.get_ingredients())
+      results.append(price)
+   return results
 
 def main():
 	myCoffee = Concrete_Coffee()
@@ -101,6 +159,10 @@ def main():
 	print('Ingredients: '+myCoffee.get_ingredients()+
 	'; Cost: '+str(myCoffee.get_cost())+'; sales tax = '+str(myCoffee.get_tax()))
 
+	myCoffee = Flat_Coffee(myCoffee).add(Milk)
+	print('Ingredients: '+myCoffee.get_ingredients()+
+	'; Cost: '+str(myCoffee.get_cost())+'; sales tax = '+str(myCoffee.get_tax()))
+
 	return 0
 	
 if __name__ == "__main__":
@@ -112,5 +174,6 @@ Ingredients: coffee; Cost: 1.0; sales tax = 0.1
 Ingredients: coffee, milk; Cost: 1.25; sales tax = 0.125
 Ingredients: coffee, milk, vanilla; Cost: 2.0; sales tax = 0.2
 Ingredients: coffee, milk, vanilla, sugar; Cost: 2.0; sales tax = 0.2
+Ingredients: coffee, milk, vanilla, sugar, milk; Cost: 2.25; sales tax = 0.225
 [Finished in 0.1s]
 """
\ No newline at end of file
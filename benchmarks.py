@@ -0,0 +1,393 @@
+"""
+Benchmarks:
+Times the hot operation of every pattern module at a few scales and writes the
+results as JSON, optionally comparing them against a saved baseline.
+
+Usage:
+python benchmarks.py                              # print results
+python benchmarks.py --only import                # import-time budget only
+python benchmarks.py --save baseline.json         # save results
+python benchmarks.py --baseline baseline.json     # report regressions
+"""
+
+import argparse
+import importlib
+import json
+import os
+import subprocess
+import sys
+import timeit
+from abc import ABCMeta
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+MODULES = {
+    "AbstractFactory": "design_patterns.creational.abstract_factory",
+    "FactoryMethod": "design_patterns.creational.factory_method",
+    "Prototype": "design_patterns.creational.prototype",
+    "Singleton": "design_patterns.creational.singleton",
+    "Adapter": "design_patterns.structural.adapter",
+    "Bridge": "design_patterns.structural.bridge",
+    "Composite": "design_patterns.structural.composite",
+    "Decorator": "design_patterns.structural.decorator",
+    "Command": "design_patterns.behavioral.command",
+    "Observer": "design_patterns.behavioral.observer",
+    "Strategy": "design_patterns.behavioral.strategy",
+    "Template_Method": "design_patterns.behavioral.template_method",
+}
+
+SCALES = (10, 100, 1000)
+
+# Worker counts for the parallel benchmarks.
+WORKERS = tuple(range(1, (os.cpu_count() or 1) + 1))
+
+# Seconds allowed for a cold import of every pattern module.
+IMPORT_BUDGET = 0.5
+
+IMPORT_SCRIPT = """
+import time
+start = time.perf_counter()
+{}
+print(time.perf_counter() - start)
+"""
+
+IMPORTS = {
+    "import.all_modules": "import design_patterns; design_patterns.all_modules()",
+    "import.decorator": "import design_patterns.structural.decorator",
+}
+
+
+def load(name):
+    return importlib.import_module(MODULES[name])
+
+
+def import_time(statement=IMPORTS["import.all_modules"], repeat=5):
+    """
+    Best cold time of running the import statement, each run in a fresh interpreter.
+    """
+    script = IMPORT_SCRIPT.format(statement)
+    return min(float(subprocess.check_output([sys.executable, "-c", script], cwd=ROOT))
+               for _ in range(repeat))
+
+
+# Each benchmark takes the module and a scale and returns the callable to time.
+
+def bench_abstract_factory(m, n):
+    factory = m.AtmaFactory()
+    return lambda: [factory.getX() for _ in range(n)]
+
+
+def bench_abstract_factory_flyweight(m, n):
+    factory = m.FlyweightFactory(m.AtmaFactory())
+    return lambda: [factory.getX() for _ in range(n)]
+
+
+def bench_create_component(m, n):
+    factory = m.Product1Factory()
+    names = ["Component1", "Component2", "Component3"] * n
+    return lambda: [factory.create_component(name) for name in names]
+
+
+def bench_create_many(m, n):
+    factory = m.Product1Factory()
+    names = ["Component1", "Component2", "Component3"] * n
+    return lambda: factory.create_many(names)
+
+
+def bench_prototype_clone(m, n):
+    prototype = m.Type1(1)
+    return lambda: [prototype.clone() for _ in range(n)]
+
+
+def bench_singleton(m, n):
+    m.Singleton.getInstance()
+    return lambda: [m.Singleton.getInstance() for _ in range(n)]
+
+
+def bench_adapter(m, n):
+    adapter = m.Adapter(m.Socket())
+    return lambda: [adapter.live() for _ in range(n)]
+
+
+def bench_adapter_generated(m, n):
+    adapter_class = m.make_adapter(m.USASocketInterface, {"live": "live", "neutral": "neutral"},
+                                   {"voltage": lambda self: m.USA_VOLTAGE})
+    adapter = adapter_class(m.Socket())
+    return lambda: [adapter.live() for _ in range(n)]
+
+
+def bench_bridge(m, n):
+    abstraction = m.Abstraction(m.ConcreteImplementorA())
+    return lambda: [abstraction.operation() for _ in range(n)]
+
+
+def bench_composite_operation(m, n):
+    root = m.Composite()
+    for _ in range(n):
+        child = m.Composite()
+        root.add(child)
+        for _ in range(10):
+            child.add(m.Leaf1())
+    return root.operation
+
+
+def deep_tree(m, depth):
+    # A chain of depth composites with one leaf at the bottom.
+    root = node = m.Composite()
+    for _ in range(depth - 1):
+        child = m.Composite()
+        node.add(child)
+        node = child
+    node.add(m.Leaf1())
+    return root
+
+
+def large_tree(m, nodes, fanout=10):
+    # A balanced tree of nodes components, laid out like a heap: the
+    # children of component i are fanout * i + 1 ... fanout * i + fanout.
+    components = [m.Composite() if fanout * i + 1 < nodes else m.Leaf1() for i in range(nodes)]
+    for i in range(1, nodes):
+        components[(i - 1) // fanout].add(components[i])
+    return components[0]
+
+
+def lopsided_tree(m, nodes):
+    # Most of the nodes in one large subtree, the rest as leaves beside it.
+    root = m.Composite()
+    root.add(large_tree(m, nodes * 9 // 10))
+    for _ in range(nodes // 10):
+        root.add(m.Leaf1())
+    return root
+
+
+def bench_composite_deep_operation(m, n):
+    return deep_tree(m, n).operation
+
+
+def bench_composite_deep_iter_operation(m, n):
+    root = deep_tree(m, n)
+    return lambda: list(root.iter_operation())
+
+
+def bench_composite_large_operation(m, n):
+    return large_tree(m, n).operation
+
+
+def bench_composite_large_iter_operation(m, n):
+    root = large_tree(m, n)
+    return lambda: list(root.iter_operation())
+
+
+def bench_composite_parallel_operation(m, n):
+    # Here n is the number of workers; the tree is the same at every scale.
+    root = lopsided_tree(m, 10 ** 5)
+    return lambda: root.parallel_operation(max_workers=n)
+
+
+# The decorator classes as they were with six.add_metaclass(ABCMeta) and
+# no __slots__, to compare construction against.
+
+class LegacyCoffee(metaclass=ABCMeta):
+    def get_cost(self):
+        pass
+
+    def get_ingredients(self):
+        pass
+
+
+class LegacyConcreteCoffee(LegacyCoffee):
+    def get_cost(self):
+        return 1.00
+
+    def get_ingredients(self):
+        return 'coffee'
+
+
+class LegacyCoffeeDecorator(LegacyCoffee, metaclass=ABCMeta):
+    def __init__(self, decorated_coffee):
+        self.decorated_coffee = decorated_coffee
+
+
+class LegacySugar(LegacyCoffeeDecorator):
+    def __init__(self, decorated_coffee):
+        LegacyCoffeeDecorator.__init__(self, decorated_coffee)
+
+
+class LegacyMilk(LegacyCoffeeDecorator):
+    def __init__(self, decorated_coffee):
+        LegacyCoffeeDecorator.__init__(self, decorated_coffee)
+
+
+def bench_decorator_construct(m, n):
+    def construct():
+        for _ in range(n):
+            m.Sugar(m.Milk(m.Concrete_Coffee()))
+    return construct
+
+
+def bench_decorator_construct_legacy(m, n):
+    def construct():
+        for _ in range(n):
+            LegacySugar(LegacyMilk(LegacyConcreteCoffee()))
+    return construct
+
+
+def bench_decorator_get_cost(m, n):
+    coffee = m.Concrete_Coffee()
+    for _ in range(n):
+        coffee = m.Milk(coffee)
+    # get_cost() recurses once per decorator, past the default limit at 1000.
+    sys.setrecursionlimit(max(sys.getrecursionlimit(), n + 100))
+    return coffee.get_cost
+
+
+def bench_decorator_flat_get_cost(m, n):
+    coffee = m.Concrete_Coffee()
+    for _ in range(n):
+        coffee = m.Milk(coffee)
+    return m.Flat_Coffee(coffee).get_cost
+
+
+def bench_invoker_execute(m, n):
+    class Receiver:
+        def action(self):
+            pass
+
+    invoker = m.Invoker()
+    for _ in range(n):
+        invoker.store_command(m.ConcreteCommand(Receiver()))
+    return invoker.execute_commands
+
+
+def bench_subject_notify(m, n):
+    class Observer(m.Observer):
+        def update(self, arg):
+            self._observer_state = arg
+
+    subject = m.Subject()
+    for _ in range(n):
+        subject.attach(Observer())
+    return subject._notify
+
+
+def bench_strategy(m, n):
+    strategy = m.Strategy(lambda self: self.name)
+    return lambda: [strategy.execute() for _ in range(n)]
+
+
+def bench_template_method(m, n):
+    meal = m.MakeMeal()
+    return lambda: [meal.go() for _ in range(n)]
+
+
+# (module, benchmark[, scales]); benchmarks without their own scales use SCALES.
+BENCHMARKS = [
+    ("AbstractFactory", bench_abstract_factory),
+    ("AbstractFactory", bench_abstract_factory_flyweight),
+    ("FactoryMethod", bench_create_component),
+    ("FactoryMethod", bench_create_many),
+    ("Prototype", bench_prototype_clone),
+    ("Singleton", bench_singleton),
+    ("Adapter", bench_adapter),
+    ("Adapter", bench_adapter_generated),
+    ("Bridge", bench_bridge),
+    ("Composite", bench_composite_operation),
+    ("Composite", bench_composite_deep_operation, (10 ** 5,)),
+    ("Composite", bench_composite_deep_iter_operation, (10 ** 5,)),
+    ("Composite", bench_composite_large_operation, (10 ** 6,)),
+    ("Composite", bench_composite_large_iter_operation, (10 ** 6,)),
+    ("Composite", bench_composite_parallel_operation, WORKERS),
+    ("Decorator", bench_decorator_construct, (10 ** 6,)),
+    ("Decorator", bench_decorator_construct_legacy, (10 ** 6,)),
+    ("Decorator", bench_decorator_get_cost),
+    ("Decorator", bench_decorator_flat_get_cost),
+    ("Command", bench_invoker_execute),
+    ("Observer", bench_subject_notify),
+    ("Strategy", bench_strategy),
+    ("Template_Method", bench_template_method),
+]
+
+
+def measure(func, repeat=5, min_time=0.05):
+    """
+    Best time of one call in seconds, taken over repeat runs of enough
+    calls to last at least min_time.
+    """
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    number = max(1, int(number * min_time / 0.2))
+    return min(timer.repeat(repeat, number)) / number
+
+
+def run(scales=None, only=None):
+    """
+    Time every benchmark, at the given scales if any, otherwise at its own.
+    """
+    modules = {}
+    results = {}
+    for key, statement in IMPORTS.items():
+        if not only or any(word in key for word in only):
+            results[key] = {"cold": import_time(statement)}
+    for name, bench, *own in BENCHMARKS:
+        key = name + "." + bench.__name__[len("bench_"):]
+        if only and not any(word in key for word in only):
+            continue
+        if name not in modules:
+            modules[name] = load(name)
+        results[key] = {str(n): measure(bench(modules[name], n))
+                        for n in scales or (own[0] if own else SCALES)}
+    return results
+
+
+def compare(results, baseline, threshold):
+    """
+    Return (key, scale, ratio) for every result slower than the baseline
+    by more than threshold.
+    """
+    regressions = []
+    for key, timings in results.items():
+        for scale, seconds in timings.items():
+            before = baseline.get(key, {}).get(scale)
+            if before and seconds / before > threshold:
+                regressions.append((key, scale, seconds / before))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[2])
+    parser.add_argument("--scales", type=int, nargs="+",
+                        help="run every benchmark at these scales instead of its own")
+    parser.add_argument("--only", nargs="+", help="run benchmarks whose name contains any of these")
+    parser.add_argument("--save", help="write the results to this JSON file")
+    parser.add_argument("--baseline", help="compare against this JSON file")
+    parser.add_argument("--threshold", type=float, default=1.2,
+                        help="slowdown ratio reported as a regression")
+    parser.add_argument("--import-budget", type=float, default=IMPORT_BUDGET,
+                        help="seconds allowed for importing every pattern module")
+    args = parser.parse_args()
+
+    results = run(args.scales, args.only)
+    print(json.dumps(results, indent=2, sort_keys=True))
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+
+    status = 0
+    seconds = results.get("import.all_modules", {}).get("cold")
+    if seconds is not None and seconds > args.import_budget:
+        print("IMPORT BUDGET exceeded: %.3fs > %.3fs" % (seconds, args.import_budget), file=sys.stderr)
+        status = 1
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.threshold)
+        for key, scale, ratio in regressions:
+            print("REGRESSION %s @ %s: %.2fx slower" % (key, scale, ratio), file=sys.stderr)
+        if regressions:
+            status = 1
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,76 @@
+"""
+Design Patterns:
+Importable access to the pattern modules, which live next to their diagrams in
+the Creational-Patterns, Structural-Patterns and Behavioral-Patterns folders.
+
+   from design_patterns.creational import singleton
+   import design_patterns.structural.composite
+
+Nothing is imported until a pattern module is first used, and importing one
+does not run its demo; that only happens when the file is run as a script.
+"""
+
+import importlib
+import importlib.abc
+import importlib.util
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+MODULES = {
+   "creational": {
+      "abstract_factory": "Creational-Patterns/Abstract-Factory/AbstractFactory.py",
+      "factory_method": "Creational-Patterns/Factory-Method/FactoryMethod.py",
+      "prototype": "Creational-Patterns/Prototype/Prototype.py",
+      "singleton": "Creational-Patterns/Singleton/Singleton.py",
+   },
+   "structural": {
+      "adapter": "Structural-Patterns/Adapter/Adapter.py",
+      "bridge": "Structural-Patterns/Bridge/Bridge.py",
+      "composite": "Structural-Patterns/Composite/Composite.py",
+      "decorator": "Structural-Patterns/Decorator/Decorator.py",
+   },
+   "behavioral": {
+      "command": "Behavioral-Patterns/Command/Command.py",
+      "observer": "Behavioral-Patterns/Observer/Observer.py",
+      "strategy": "Behavioral-Patterns/Strategy/Strategy.py",
+      "template_method": "Behavioral-Patterns/Template-Method/Template_Method.py",
+   },
+}
+
+class _PatternFinder(importlib.abc.MetaPathFinder):
+   """ Finds design_patterns.<group>.<pattern> in its pattern folder. """
+
+   def find_spec(self, fullname, path=None, target=None):
+      parts = fullname.split(".")
+      if len(parts) != 3 or parts[0] != __name__:
+         return None
+      location = MODULES.get(parts[1], {}).get(parts[2])
+      if location is None:
+         return None
+      return importlib.util.spec_from_file_location(fullname, os.path.join(ROOT, location))
+
+if not any(isinstance(finder, _PatternFinder) for finder in sys.meta_path):
+   sys.meta_path.append(_PatternFinder())
+
+def lazy_module(package, name):
+   """ Import package.name on first attribute access (PEP 562). """
+   if name not in MODULES[package.rpartition(".")[2]]:
+      raise AttributeError("module %r has no attribute %r" % (package, name))
+   return importlib.import_module(package + "." + name)
+
+def __getattr__(name):
+   if name not in MODULES:
+      raise AttributeError("module %r has no attribute %r" % (__name__, name))
+   return importlib.import_module(__name__ + "." + name)
+
+def __dir__():
+   return sorted(set(globals()) | set(MODULES))
+
+def all_modules():
+   """ Import every pattern module and return them by dotted name. """
+   return {
+      group + "." + name: importlib.import_module(__name__ + "." + group + "." + name)
+      for group in MODULES for name in MODULES[group]
+   }
@@ -0,0 +1,11 @@
+"""
+Behavioral patterns. Each pattern module is imported on first use.
+"""
+
+from design_patterns import MODULES, lazy_module
+
+def __getattr__(name):
+   return lazy_module(__name__, name)
+
+def __dir__():
+   return sorted(set(globals()) | set(MODULES["behavioral"]))